@@ -0,0 +1,194 @@
+import streamlit as st
+import google.generativeai as genai
+import textwrap
+import threading
+import zipfile
+import numpy as np
+from io import BytesIO
+from sentence_transformers import SentenceTransformer
+
+
+# Configure the API key and build the model once per process instead of
+# on every script rerun
+@st.cache_resource
+def get_model():
+    genai.configure(api_key=st.secrets["GOOGLE_API_KEY"])
+    return genai.GenerativeModel("gemini-1.5-flash")
+
+# Memoize responses so repeated prompts skip the LLM round-trip
+@st.cache_data(ttl=86400, show_spinner=False)
+def generate_app_code(prompt: str) -> str:
+    return get_model().generate_content(prompt).text
+
+# Load the embedding model once per process
+@st.cache_resource
+def get_embedder():
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+# Semantic cache of (embedding, prompt, response) triples, shared across sessions
+_semantic_cache = []
+_semantic_cache_lock = threading.Lock()
+_SIMILARITY_THRESHOLD = 0.92
+
+def semantic_lookup(prompt: str):
+    """Return (embedding, response) for a semantically similar prompt, response=None on miss."""
+    embedding = get_embedder().encode(prompt, normalize_embeddings=True)
+    with _semantic_cache_lock:
+        if _semantic_cache:
+            similarities = np.stack([e for e, _, _ in _semantic_cache]) @ embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] > _SIMILARITY_THRESHOLD:
+                return embedding, _semantic_cache[best][2]
+    return embedding, None
+
+def semantic_store(embedding, prompt: str, response: str):
+    with _semantic_cache_lock:
+        _semantic_cache.append((embedding, prompt, response))
+
+def generate_with_semantic_cache(prompt: str) -> str:
+    """Return a cached response for a semantically similar prompt, else call the LLM."""
+    embedding, response = semantic_lookup(prompt)
+    if response is None:
+        response = generate_app_code(prompt)
+        semantic_store(embedding, prompt, response)
+    return response
+
+def stream_app_code(prompt: str):
+    """Yield response text chunks as Gemini produces them."""
+    for chunk in get_model().generate_content(prompt, stream=True):
+        yield chunk.text
+
+# Simulated app code output; the templates are indented to read well here
+# and get dedented once at import below
+_APP_CODE_RAW = {
+    "src/main/java/com/example/app/MainActivity.java": """
+        package com.example.app;
+        import android.os.Bundle;
+        import androidx.appcompat.app.AppCompatActivity;
+        public class MainActivity extends AppCompatActivity {
+            @Override
+            protected void onCreate(Bundle savedInstanceState) {
+                super.onCreate(savedInstanceState);
+                setContentView(R.layout.activity_main);
+            }
+        }
+    """,
+    "src/main/AndroidManifest.xml": """
+        <manifest xmlns:android="http://schemas.android.com/apk/res/android"
+                  package="com.example.app">
+            <application
+                android:label="My App"
+                android:icon="@mipmap/ic_launcher">
+                <activity android:name=".MainActivity">
+                    <intent-filter>
+                        <action android:name="android.intent.action.MAIN" />
+                        <category android:name="android.intent.category.LAUNCHER" />
+                    </intent-filter>
+                </activity>
+            </application>
+        </manifest>
+    """,
+    "src/main/res/layout/activity_main.xml": """
+        <LinearLayout xmlns:android="http://schemas.android.com/apk/res/android"
+                      android:layout_width="match_parent"
+                      android:layout_height="match_parent"
+                      android:orientation="vertical"
+                      android:padding="16dp">
+            <TextView
+                android:layout_width="wrap_content"
+                android:layout_height="wrap_content"
+                android:text="Welcome to the Generated App!"
+                android:textSize="18sp"
+                android:layout_gravity="center_horizontal" />
+            <Button
+                android:layout_width="wrap_content"
+                android:layout_height="wrap_content"
+                android:text="Click Me"
+                android:layout_gravity="center_horizontal" />
+        </LinearLayout>
+    """,
+    "build.gradle": """
+        plugins {
+            id 'com.android.application'
+        }
+        android {
+            compileSdkVersion 33
+            defaultConfig {
+                applicationId "com.example.app"
+                minSdkVersion 21
+                targetSdkVersion 33
+                versionCode 1
+                versionName "1.0"
+            }
+            buildTypes {
+                release {
+                    minifyEnabled false
+                }
+            }
+        }
+        dependencies {
+            implementation "androidx.appcompat:appcompat:1.4.1"
+            implementation "com.google.android.material:material:1.5.0"
+        }
+    """,
+}
+
+# Dedent and encode every template exactly once, at module load: the
+# generated files come out flush-left (valid Gradle/XML) and the ZIP
+# carries no indentation padding
+APP_CODE_TEMPLATE: dict[str, bytes] = {
+    name: textwrap.dedent(content).lstrip().encode("utf-8")
+    for name, content in _APP_CODE_RAW.items()
+}
+
+# Deflate only pays for itself on larger entries; storing the small text
+# files skips a zlib compressor allocation per entry
+_DEFLATE_THRESHOLD = 4096
+
+def _method_for(content: bytes) -> int:
+    return zipfile.ZIP_DEFLATED if len(content) >= _DEFLATE_THRESHOLD else zipfile.ZIP_STORED
+
+def _write_entries(zipf, entries):
+    # Sorted entries (plus the fixed ZipInfo timestamp) make the
+    # archive bytes deterministic, so identical input always yields
+    # an identical ZIP that outer caches can hit
+    for file_name, file_content in sorted(entries.items()):
+        if isinstance(file_content, str):
+            file_content = file_content.encode("utf-8")
+        info = zipfile.ZipInfo(file_name)
+        info.compress_type = _method_for(file_content)
+        zipf.writestr(info, file_content)
+
+# Helper function to build the zip file directly from the in-memory app code
+def build_zip_from_dict(app_code):
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        _write_entries(zipf, app_code)
+    return zip_buffer.getvalue()
+
+# The template entries are identical for every prompt, so serialize them
+# once at import; per request only the LLM-derived entries are appended
+# (ZIP keeps its central directory at the end, so appending rewrites the
+# directory record without re-deflating the constant entries)
+_BASE_ZIP_BYTES = build_zip_from_dict(APP_CODE_TEMPLATE)
+
+def build_zip(dynamic_entries=None):
+    """Return ZIP bytes: the pre-built template plus any per-prompt entries."""
+    if not dynamic_entries:
+        return _BASE_ZIP_BYTES
+    zip_buffer = BytesIO(_BASE_ZIP_BYTES)
+    with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        _write_entries(zipf, dynamic_entries)
+    return zip_buffer.getvalue()
+
+# Memoize the whole pipeline, not just the LLM call: a repeat click with
+# a seen prompt returns the finished archive without touching the LLM,
+# the embedder, or zlib. The leading underscore keeps _generated_code out
+# of the cache key, so callers that already hold the response (e.g. the
+# streaming handler) can pass it in instead of re-running the lookup.
+@st.cache_data(ttl=86400, show_spinner=False)
+def build_everything(prompt: str, _generated_code: str | None = None) -> bytes:
+    """Run prompt -> generated code -> ZIP end to end and return the archive bytes."""
+    if _generated_code is None:
+        _generated_code = generate_with_semantic_cache(prompt)
+    return build_zip({"GENERATED_CODE.md": _generated_code.encode("utf-8")})
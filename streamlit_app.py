@@ -1,33 +1,13 @@
 import streamlit as st
-import google.generativeai as genai
-import os
-import zipfile
-from io import BytesIO
 from datetime import datetime
 
+from app_builder import (
+    build_everything,
+    semantic_lookup,
+    semantic_store,
+    stream_app_code,
+)
 
-# Configure the API key securely from Streamlit's secrets
-genai.configure(api_key=st.secrets["GOOGLE_API_KEY"])
-
-# Helper function to write files
-def create_file_structure(app_code, output_folder):
-    for file_name, file_content in app_code.items():
-        file_path = os.path.join(output_folder, file_name)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(file_content)
-
-# Helper function to create a zip file
-def create_zip_file(output_folder):
-    zip_buffer = BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(output_folder):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, output_folder)
-                zipf.write(file_path, arcname)
-    zip_buffer.seek(0)
-    return zip_buffer
 
 # Streamlit App UI
 st.set_page_config(page_title="Android App Generator", layout="wide")
@@ -49,105 +29,32 @@ timestamp_output = st.sidebar.checkbox("Add Timestamp to Output Files", value=Tr
 
 if st.button("Generate Android App Code"):
     try:
-        # Load and configure the model
-        model = genai.GenerativeModel("gemini-1.5-flash")
-
-        # Generate response from the model
+        # Generate response from the model, streaming tokens into the
+        # page as they arrive; cached prompts skip streaming entirely
         st.info("Generating app code, please wait...")
-        response = model.generate_content(prompt)
-
-        # Simulated app code output
-        app_code = {
-            "src/main/java/com/example/app/MainActivity.java": """ 
-                package com.example.app;
-                import android.os.Bundle;
-                import androidx.appcompat.app.AppCompatActivity;
-                public class MainActivity extends AppCompatActivity {
-                    @Override
-                    protected void onCreate(Bundle savedInstanceState) {
-                        super.onCreate(savedInstanceState);
-                        setContentView(R.layout.activity_main);
-                    }
-                }
-            """,
-            "src/main/AndroidManifest.xml": """
-                <manifest xmlns:android="http://schemas.android.com/apk/res/android"
-                          package="com.example.app">
-                    <application
-                        android:label="My App"
-                        android:icon="@mipmap/ic_launcher">
-                        <activity android:name=".MainActivity">
-                            <intent-filter>
-                                <action android:name="android.intent.action.MAIN" />
-                                <category android:name="android.intent.category.LAUNCHER" />
-                            </intent-filter>
-                        </activity>
-                    </application>
-                </manifest>
-            """,
-            "src/main/res/layout/activity_main.xml": """
-                <LinearLayout xmlns:android="http://schemas.android.com/apk/res/android"
-                              android:layout_width="match_parent"
-                              android:layout_height="match_parent"
-                              android:orientation="vertical"
-                              android:padding="16dp">
-                    <TextView
-                        android:layout_width="wrap_content"
-                        android:layout_height="wrap_content"
-                        android:text="Welcome to the Generated App!"
-                        android:textSize="18sp"
-                        android:layout_gravity="center_horizontal" />
-                    <Button
-                        android:layout_width="wrap_content"
-                        android:layout_height="wrap_content"
-                        android:text="Click Me"
-                        android:layout_gravity="center_horizontal" />
-                </LinearLayout>
-            """,
-            "build.gradle": """
-                plugins {
-                    id 'com.android.application'
-                }
-                android {
-                    compileSdkVersion 33
-                    defaultConfig {
-                        applicationId "com.example.app"
-                        minSdkVersion 21
-                        targetSdkVersion 33
-                        versionCode 1
-                        versionName "1.0"
-                    }
-                    buildTypes {
-                        release {
-                            minifyEnabled false
-                        }
-                    }
-                }
-                dependencies {
-                    implementation "androidx.appcompat:appcompat:1.4.1"
-                    implementation "com.google.android.material:material:1.5.0"
-                }
-            """
-        }
-
-        # Temporary folder for file generation
-        output_folder = "generated_app"
-        if not os.path.exists(output_folder):
-            os.makedirs(output_folder)
-
-        # Create the file structure
-        create_file_structure(app_code, output_folder)
+        placeholder = st.empty()
+        embedding, generated_code = semantic_lookup(prompt)
+        if generated_code is None:
+            chunks = []
+            for chunk in stream_app_code(prompt):
+                chunks.append(chunk)
+                placeholder.markdown("".join(chunks))
+            generated_code = "".join(chunks)
+            semantic_store(embedding, prompt, generated_code)
+        else:
+            placeholder.markdown(generated_code)
 
         # Add timestamp if selected
         timestamp = f"_{datetime.now().strftime('%Y%m%d_%H%M%S')}" if timestamp_output else ""
         zip_file_name = f"android_app{timestamp}.zip"
 
-        # Create the ZIP file
-        zip_file = create_zip_file(output_folder)
+        # Whole pipeline memoized on the prompt; pass the response we
+        # already hold so a cold prompt is not generated a second time
+        zip_bytes = build_everything(prompt, generated_code)
 
         # Provide a download link
         st.success("Android app generated successfully!")
-        st.download_button("Download ZIP File", zip_file, file_name=zip_file_name)
+        st.download_button("Download ZIP File", zip_bytes, file_name=zip_file_name)
 
         # Advanced features
         if generate_ui_preview: